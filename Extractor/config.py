@@ -23,6 +23,9 @@ STATE_MIN_WAGE_URL = "https://www.dol.gov/agencies/whd/minimum-wage/state"
 TIPPED_WAGE_START_YEAR = 2003
 TIPPED_WAGE_END_YEAR = 2024
 REQUEST_TIMEOUT = 30
+# Cache HTTP em disco (sqlite); páginas do DOL mudam raramente
+HTTP_CACHE_NAME = "dol_http_cache"
+HTTP_CACHE_EXPIRE = 24 * 60 * 60
 
 # Configurações de frequência
 FREQUENCY_MAP = {
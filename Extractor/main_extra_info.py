@@ -89,19 +89,30 @@ class ExtraInfoPipeline:
         """
         logger.info("Initiating Phase 1: Data Extraction")
         
-        scraper = ExtraInfoScraper()
-        scraped_data = scraper.scrape_all()
-        
-        if not scraped_data:
-            raise Exception("❌ Falha ao extrair dados")
+        with ExtraInfoScraper() as scraper:
+            scraped_data = scraper.scrape_all()
+            
+            if not scraped_data:
+                raise Exception("❌ Falha ao extrair dados")
+            
+            # Snapshot bruto da extração para inspeção/reprocessamento
+            scraper.save_jsonl(
+                os.path.join(self.output_dir, f"extra_info_{self.timestamp}.jsonl"),
+                scraped_data.items()
+            )
         
         return scraped_data
     
-    async def run_processing(self, scraped_data: dict) -> dict:
+    async def run_processing(
+        self,
+        scraped_data: dict,
+        processor: Optional[ExtraInfoProcessor] = None
+    ) -> dict:
         """Fase 2: Processamento e inserção no LightRAG (async)."""
         logger.info("Initiating Phase 2: LightRAG Processing")
         
-        processor = await ExtraInfoProcessor.create()
+        if processor is None:
+            processor = await ExtraInfoProcessor.create()
         stats = await processor.process(scraped_data)
         
         return stats
@@ -115,11 +126,17 @@ class ExtraInfoPipeline:
         start_time = datetime.now()
         
         try:
-            # Fase 1: Extração
-            scraped_data = self.run_extraction()
+            # Fase 1: Extração em uma thread, enquanto o LightRAG e o modelo
+            # de embeddings são inicializados no event loop
+            processor_task = asyncio.ensure_future(ExtraInfoProcessor.create())
+            try:
+                scraped_data = await asyncio.to_thread(self.run_extraction)
+            except Exception:
+                processor_task.cancel()
+                raise
             
             # Fase 2: Processamento (LightRAG)
-            processing_stats = await self.run_processing(scraped_data)
+            processing_stats = await self.run_processing(scraped_data, await processor_task)
             
             # Fase 3: Transformação (PostgreSQL)
             transformation_stats = self.run_transformation(scraped_data)
@@ -169,52 +186,14 @@ class ExtraInfoPipeline:
         return stats
     
     def run(self):
-        """Executa o pipeline completo."""
-        print("\n" + "=" * 80)
-        print("INICIANDO PIPELINE DE INFORMAÇÕES EXTRAS DE LEIS TRABALHISTAS")
-        print("=" * 80)
-        
-        start_time = datetime.now()
-        
-        try:
-            # Fase 1: Extração
-            scraped_data = self.run_extraction()
-            
-            # Fase 2: Processamento (LightRAG)
-            processing_stats = self.run_processing(scraped_data)
-            
-            # Fase 3: Transformação (PostgreSQL)
-            transformation_stats = self.run_transformation(scraped_data)
-            
-            # Resumo final
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
-            print("\n" + "=" * 80)
-            print("PIPELINE CONCLUÍDO COM SUCESSO!")
-            print("=" * 80)
-            print(f"\n⏱️  Tempo total: {duration:.2f} segundos")
-            print(f"📊 Total de documentos processados: {processing_stats['total_documents']}")
-            print(f"📊 Total de footnotes processados: {processing_stats['total_footnotes']}")
-            
-            return {
-                'scraped_data': scraped_data,
-                'processing_stats': processing_stats,
-                'transformation_stats': transformation_stats,
-                'duration': duration
-            }
-            
-        except Exception as e:
-            print(f"\n❌ ERRO NO PIPELINE: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            raise
+        """Executa o pipeline completo (wrapper síncrono de run_async)."""
+        return asyncio.run(self.run_async())
 
 
 def main():
     """Função principal."""
     pipeline = ExtraInfoPipeline()
-    results = asyncio.run(pipeline.run_async())
+    results = pipeline.run()
     return results
 
 
@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple
 
 import dotenv
 import numpy as np
+import orjson
 from google import genai
 from google.genai import types
 from lightrag import LightRAG
@@ -141,15 +142,16 @@ class ExtraInfoProcessor:
             text = doc.get('text', '')
             if not text.strip():
                 continue
-            metadata_lines = [
-                f"{k}: {v}" for k, v in {
-                    'data_type': data_type, 'category': doc_category,
-                    'topic': doc.get('topic', ''), 'type': doc.get('type', ''),
-                    'site_url': doc.get('site_url', ''), 'state': doc.get('state', ''),
-                    'regulation_category': doc.get('category', '')
-                }.items() if v
-            ]
-            text_with_meta = "[METADATA]\n" + "\n".join(metadata_lines) + "\n[/METADATA]\n\n" + text
+            meta = {
+                k: v for k, v in (
+                    ('data_type', data_type), ('category', doc_category),
+                    ('topic', doc.get('topic', '')), ('type', doc.get('type', '')),
+                    ('site_url', doc.get('site_url', '')), ('state', doc.get('state', '')),
+                    ('regulation_category', doc.get('category', ''))
+                ) if v
+            }
+            # LightRAG só aceita str em ainsert, então o bloco JSON é decodificado aqui
+            text_with_meta = "[METADATA]\n" + orjson.dumps(meta).decode() + "\n[/METADATA]\n\n" + text
             
             # Fixo 4: Usar a função assíncrona 'ainsert'
             tasks.append(self.rag.ainsert(text_with_meta))
@@ -3,8 +3,6 @@ Processador de dados de salário mínimo padrão
 """
 import pandas as pd
 import re
-import sys
-sys.path.append('..')
 from utils import add_leading_zero, extract_multiple_values, append_note
 from typing import Dict, Tuple
 import warnings
@@ -3,9 +3,7 @@ Processador de dados de tipped minimum wage
 """
 import pandas as pd
 import re
-import sys
 import ast
-sys.path.append('..')
 from utils import is_monetary_value, is_percentage, extract_multiple_values, append_note, consolidate_notes_simple 
 import warnings
 warnings.filterwarnings('ignore')
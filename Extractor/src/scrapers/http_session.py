@@ -0,0 +1,52 @@
+"""
+Shared HTTP session for the Department of Labor scrapers.
+
+Every scraper talks to the same host (www.dol.gov), so they share a single
+pooled, disk-cached session: connections and TLS handshakes are reused
+across scrapers, and unchanged pages are revalidated instead of downloaded.
+"""
+
+import threading
+from typing import Optional
+
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+from config import HTTP_CACHE_EXPIRE, HTTP_CACHE_NAME
+
+_session: Optional[CachedSession] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> CachedSession:
+    """
+    Return the process-wide session used by the scrapers, creating it on first use.
+
+    Returns
+    -------
+    CachedSession
+        Session with an sqlite response cache (ETag/Last-Modified
+        revalidation), a retrying connection pool and default headers
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = CachedSession(
+                HTTP_CACHE_NAME,
+                backend="sqlite",
+                expire_after=HTTP_CACHE_EXPIRE,
+                cache_control=True,
+                allowable_codes=(200,)
+            )
+            session.headers.update({
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "DOLScraper/1.0"
+            })
+            session.mount("https://", HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            ))
+            _session = session
+        return _session
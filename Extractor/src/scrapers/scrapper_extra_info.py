@@ -10,13 +10,24 @@ website. It focuses on:
 - Regulatory compliance requirements
 """
 
+import io
 import logging
-import re
-from typing import Dict, List, Optional, Tuple, Union
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import orjson
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
+from lxml import html as lxml_html
+
+from .http_session import get_session
+
+# Extractors running at once in iter_all; bounds how many pages and results are held in memory
+MAX_EXTRACTOR_WORKERS = 4
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,6 +36,174 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Parse only the subtree we read; skips nav/header/footer/script nodes
+CONTENT_STRAINER = SoupStrainer("div", id="content")
+
+# Compiled XPath queries for footnote lookups, evaluated inside libxml2
+_FOOT_P = etree.XPath("//p[starts-with(@id, 'foot')]")
+_NAMED_A = etree.XPath(".//a[@name]")
+_CONTENT_DIV = etree.XPath("//div[@id = $div]")
+_FOOTNOTE_HEADER = etree.XPath(
+    "./*[contains(translate(string(.), 'footne', 'FOOTNE'), 'FOOTNOTE')][1]"
+)
+_FOLLOWING_SIBLINGS = etree.XPath("following-sibling::*")
+_TABLE_SIBLINGS = etree.XPath(".//table/following-sibling::*")
+_TOP_TABLES = etree.XPath("//table[not(ancestor::table)]")
+
+# Footnote markers left in scraped headers and state names, as str.translate
+# deletion tables (no regex engine needed for a fixed character set)
+_COL_STRIP = str.maketrans("", "", "0123456789/:")
+_DIGIT_STRIP = str.maketrans("", "", "0123456789")
+# Letter markers that prefix the child labor footnote paragraphs
+_FOOT_MARKERS = frozenset("abcABC")
+
+# Document topics, shared by the state and footnote documents of each page
+_REST_TOPIC = "Minimum Paid Rest Period Requirements Under State Law for Adult Employees in Private Sector"
+_MEAL_TOPIC = "Meal Period Requirements Under State Law"
+_THRESHOLD_TOPIC = "Dollar Threshold Amount for Contract Coverage Under State Prevailing Wage Laws"
+_PAYDAY_TOPIC = "Pay Frequency Requirements by State"
+_CHILD_NON_FARM_TOPIC = "Child Labor State Laws and Restrictions for Minors"
+_CHILD_FARM_TOPIC = "State Child Labor Laws Applicable to Agricultural Employment"
+_CHILD_FARM_HAZARDOUS_TOPIC = "Hazardous Agricultural Occupations Restrictions for Minors Under State Law"
+_ENTERTAINMENT_TOPIC = "State Child Entertainment Employment Laws for Minors"
+_DOOR_TO_DOOR_TOPIC = "State Regulation of For-profit Door-to-door Sales by Minors"
+
+# Document templates, filled per table row with str.format_map
+_REST_TEMPLATE = """In {State}, adult employees in the private sector are entitled to {Basic Standard}.
+This regulation is established by {Prescribed By} and applies to {Coverage}.
+Additional notes: {Comments}."""
+
+_MEAL_TEMPLATE = """In {Jurisdiction}, meal periods for adult employees in the private sector are regulated by state law.
+The standard is: {Basic Standard}.
+Prescribed by: {Prescribed By}.
+Coverage: {Coverage}.
+Comments: {Comments}."""
+
+_THRESHOLD_TEMPLATE = """In {State}, the dollar threshold amount for contract coverage under state prevailing wage laws is {Threshold amount}.
+This indicates the minimum contract value at which prevailing wage requirements apply to public works or government-funded projects in {State}."""
+
+_PAYDAY_TEMPLATE = """In {State}, the pay frequency requirements for private sector employers are as follows:
+- Weekly: {Weekly}
+- Bi-weekly: {Bi-weekly}
+- Semi-monthly: {Semi-monthly}
+- Monthly: {Monthly}."""
+_PAYDAY_DEFAULTS = dict.fromkeys(('Weekly', 'Bi-weekly', 'Semi-monthly', 'Monthly'), 'N/A')
+
+_CHILD_NON_FARM_TEMPLATE = """In {State}, child labor laws define the following limitations for minors in Non-farm Employment:
+- Maximum daily and weekly hours (Under 16): {max_daily_weekly_under16}
+- Maximum daily and weekly hours (Ages 16 and 17): {max_daily_weekly_16_17}
+- Nightwork prohibited (Under 16): {nightwork_under16}
+- Nightwork prohibited (Ages 16 and 17): {nightwork_16_17}."""
+
+_CHILD_FARM_TEMPLATE = """In {State}, child labor laws applicable to agricultural employment establish the following conditions:
+- Minimum age during school hours: {min_age_during_school}
+- Minimum age outside school hours: {min_age_outside_school}
+- Certificate required for employment: {employment_required_certificate}
+- Certificate required for age: {age_required_certificate}
+- Maximum daily/weekly hours for minors under 16: {max_daily_week_for_under_16}
+- Maximum days per week for minors under 16: {max_day_per_week_for_under_16}."""
+
+_CHILD_FARM_HAZARDOUS_TEMPLATE = """In {State}, additional child labor restrictions apply to agricultural work involving hazardous occupations:
+- Agricultural work prohibited for minors under 16 unless specific conditions apply: {prohibited_for_under_16_unless_other_age}.
+- Minimum age for engagement in hazardous agricultural occupations: {dangerous_occupation_prohibited_age}.
+
+These provisions ensure that minors are protected from hazardous agricultural tasks and environments, in accordance with state labor laws."""
+
+_ENTERTAINMENT_TEMPLATE = """In {STATE}, child entertainment employment is subject to state law as follows:
+- Regulates child entertainment: {REGULATES CHILD ENTERTAINMENT}.
+- Work permit required: {WORK PERMIT}.
+- Additional comments / legal reference: {LAW/COMMENT}.
+
+These provisions reflect {STATE}'s approach to permitting minors to work as actors, models or performers in the entertainment industry, and the accompanying safeguards regarding schooling, welfare and safety."""
+
+_DOOR_TO_DOOR_TEMPLATE = """State: {state}
+Category: {category}
+Regulation Details: {details}"""
+
+
+def _get_text(element: lxml_html.HtmlElement) -> str:
+    """Concatenate the stripped text nodes of an element, like bs4's get_text(strip=True)."""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _parse_footnotes(
+    elements: List[lxml_html.HtmlElement],
+    url: str,
+    text_offset: Optional[int] = None
+) -> List[Dict]:
+    """
+    Build footnote records from the ``<p>`` elements returned by get_footnotes.
+    
+    Parameters
+    ----------
+    elements : List[lxml.html.HtmlElement]
+        Elements following the footnotes header of a page
+    url : str
+        URL of the page the footnotes belong to
+    text_offset : int, optional
+        Number of leading marker characters to drop from the paragraph
+        text. When omitted, the marker length is inferred from the anchor
+        name (one or two digits) and the full anchor name is kept as id
+        
+    Returns
+    -------
+    List[Dict]
+        Footnote records with footnote_id, footnote_text and site_url
+    """
+    # Local bindings keep the per-element loop free of global lookups
+    named_a, get_text = _NAMED_A, _get_text
+    footnotes = []
+    append = footnotes.append
+    for el in elements:
+        if el.tag != 'p':
+            continue
+        anchors = named_a(el)
+        if not anchors:
+            continue
+        
+        name = anchors[0].get('name')
+        if text_offset is None:
+            footnote_id = name
+            offset = 2 if name[-2].isnumeric() else 1
+        else:
+            footnote_id = name[-1]
+            offset = text_offset
+        
+        append({
+            'footnote_id': footnote_id,
+            'footnote_text': get_text(el)[offset:],
+            'site_url': url
+        })
+    return footnotes
+
+
+def _footnote_docs(footnotes: List[Dict], topic: str) -> List[Dict]:
+    """
+    Turn parsed footnote records into footnote documents for one topic.
+    
+    Parameters
+    ----------
+    footnotes : List[Dict]
+        Records with footnote_id, footnote_text and site_url
+    topic : str
+        Topic shared by every footnote of the page
+        
+    Returns
+    -------
+    List[Dict]
+        Footnote documents ready for the processor
+    """
+    base = {"type": "footnote", "topic": topic}
+    return [
+        {
+            **base,
+            "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
+            "id": fn["footnote_id"],
+            "site_url": fn["site_url"]
+        }
+        for fn in footnotes
+    ]
+
 
 class ExtraInfoScraper:
     """
@@ -43,6 +222,139 @@ class ExtraInfoScraper:
         Initialize the extended information scraper with base configuration.
         """
         self.base_url = "https://www.dol.gov/agencies/whd/state"
+        # Pooled, disk-cached session shared with the other DOL scrapers
+        self.session = get_session()
+        self._html_cache: Dict[str, bytes] = {}
+        self._soup_cache: Dict[str, BeautifulSoup] = {}
+        self._tree_cache: Dict[str, lxml_html.HtmlElement] = {}
+        # Per-thread set of the pages read by the extractor running on that thread
+        self._local = threading.local()
+
+    def __enter__(self) -> "ExtraInfoScraper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the pooled HTTP connections held by the scraper session.
+        
+        The session itself (and its response cache) is shared with the other
+        scrapers and stays usable; only idle connections are dropped.
+        """
+        for adapter in self.session.adapters.values():
+            adapter.close()
+
+    def warmup(self) -> None:
+        """
+        Open a pooled connection to the DOL host before the extractors start.
+        
+        DNS resolution and the TLS handshake happen once here instead of in
+        whichever worker thread reaches the network first. The response cache
+        is bypassed, since a cached HEAD would open no connection at all.
+        Failures are ignored; the extractors report their own fetch errors.
+        """
+        try:
+            with self.session.cache_disabled():
+                self.session.head(self.base_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"Warm-up request failed: {e}")
+
+    def _get_html(self, url: str) -> bytes:
+        """
+        Return the raw HTML for a page, hitting the network only on a cache miss.
+        
+        Parameters
+        ----------
+        url : str
+            Full URL of the Department of Labor page
+            
+        Returns
+        -------
+        bytes
+            Response body of the page
+        """
+        pages = getattr(self._local, 'pages', None)
+        if pages is not None:
+            pages.add(url)
+        if url not in self._html_cache:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            self._html_cache[url] = response.content
+        return self._html_cache[url]
+
+    def _release_page(self, url: str) -> None:
+        """
+        Drop the cached bytes, soup and tree of a page.
+        
+        Parameters
+        ----------
+        url : str
+            Full URL of the Department of Labor page
+        """
+        self._html_cache.pop(url, None)
+        self._soup_cache.pop(url, None)
+        self._tree_cache.pop(url, None)
+
+    def _run_extractor(self, extractor: Callable[[], Tuple[List[Dict], List[Dict]]]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Run one extractor and release the pages it read once it finishes.
+        
+        Parameters
+        ----------
+        extractor : Callable
+            Bound ``extract_*`` method to run
+            
+        Returns
+        -------
+        Tuple[List[Dict], List[Dict]]
+            The extractor's (state_regulations, associated_footnotes)
+        """
+        self._local.pages = set()
+        try:
+            return extractor()
+        finally:
+            for url in self._local.pages:
+                self._release_page(url)
+            self._local.pages = None
+
+    def _get_soup(self, url: str) -> BeautifulSoup:
+        """
+        Return the parsed content div of a page, parsing it at most once.
+        
+        Parameters
+        ----------
+        url : str
+            Full URL of the Department of Labor page
+            
+        Returns
+        -------
+        BeautifulSoup
+            Soup restricted to the content div
+        """
+        if url not in self._soup_cache:
+            self._soup_cache[url] = BeautifulSoup(self._get_html(url), "lxml", parse_only=CONTENT_STRAINER)
+        return self._soup_cache[url]
+
+    def _get_tree(self, url: str) -> lxml_html.HtmlElement:
+        """
+        Return the lxml document tree of a page, parsing it at most once.
+        
+        Parameters
+        ----------
+        url : str
+            Full URL of the Department of Labor page
+            
+        Returns
+        -------
+        lxml.html.HtmlElement
+            Root element of the parsed page
+        """
+        if url not in self._tree_cache:
+            parser = lxml_html.HTMLParser(encoding="utf-8")
+            self._tree_cache[url] = lxml_html.document_fromstring(self._get_html(url), parser=parser)
+        return self._tree_cache[url]
 
     def get_table(self, url: str) -> List[pd.DataFrame]:
         """
@@ -62,12 +374,17 @@ class ExtraInfoScraper:
         Notes
         -----
         Tables are expected to follow DOL's standard format for
-        regulatory data presentation
+        regulatory data presentation. Only the outermost <table> elements of
+        the cached lxml tree are serialized and handed to read_html (lxml
+        flavor), so the rest of the page is not parsed a second time
         """
-        tables = pd.read_html(url)
+        markup = b"".join(
+            etree.tostring(table, with_tail=False) for table in _TOP_TABLES(self._get_tree(url))
+        )
+        tables = pd.read_html(io.BytesIO(markup), flavor="lxml")
         return tables
     
-    def get_footnotes(self, url: str, div: str = "content") -> List[Tag]:
+    def get_footnotes(self, url: str, div: str = "content") -> List[lxml_html.HtmlElement]:
         """
         Extract and parse regulatory footnotes from Department of Labor pages.
         
@@ -83,7 +400,7 @@ class ExtraInfoScraper:
             
         Returns
         -------
-        List[Tag]
+        List[lxml.html.HtmlElement]
             Collection of parsed footnote elements with their full context
             
         Notes
@@ -92,35 +409,21 @@ class ExtraInfoScraper:
         begin with a clearly marked header section
         """
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-            content = soup.find("div", id=div)
+            content = _CONTENT_DIV(self._get_tree(url), div=div)
             
             if not content:
                 logger.warning(f"No content div found with id '{div}' at {url}")
                 return []
             
-            # First try to find footnotes section by header
-            elements = list(content.children)
-            start_index = None
-            
-            for i, el in enumerate(elements):
-                if hasattr(el, "get_text") and "FOOTNOTE" in el.get_text().upper():
-                    start_index = i
-                    return elements[start_index + 1:]
+            # First try to find footnotes section by header among the direct children
+            header = _FOOTNOTE_HEADER(content[0])
+            if header:
+                return _FOLLOWING_SIBLINGS(header[0])
             
             # If no header found, look for footnotes after tables
-            tables = content.find_all("table")
-            if tables:
-                footnote_elements = []
-                for table in tables:
-                    if table.find_next_siblings():
-                        for sibling in table.find_next_siblings():
-                            if getattr(sibling, "name", None):
-                                footnote_elements.append(sibling)
-                if footnote_elements:
-                    return footnote_elements
+            footnote_elements = _TABLE_SIBLINGS(content[0])
+            if footnote_elements:
+                return footnote_elements
             
             logger.info(f"No footnotes found at {url}")
             return []
@@ -129,6 +432,43 @@ class ExtraInfoScraper:
             logger.error(f"Failed to retrieve footnotes from {url}: {e}")
             return []
 
+    def _extract_foot_paragraphs(self, url: str) -> List[Dict]:
+        """
+        Build footnote records from the ``<p id="foot*">`` paragraphs of a page.
+        
+        A leading a/b/c marker letter is dropped from the text and each anchor
+        name is emitted once.
+        
+        Parameters
+        ----------
+        url : str
+            URL of the page the footnotes belong to
+            
+        Returns
+        -------
+        List[Dict]
+            Footnote records with footnote_id, footnote_text and site_url
+        """
+        footnotes = {}
+        for p in _FOOT_P(self._get_tree(url)):
+            anchors = _NAMED_A(p)
+            if not anchors:
+                continue
+            
+            name = anchors[0].get('name')
+            if name in footnotes:
+                continue
+            
+            full_text = _get_text(p)
+            footnote_text = full_text[1:].strip() if full_text[:1] in _FOOT_MARKERS else full_text
+            
+            footnotes[name] = {
+                'footnote_id': name[-1],
+                'footnote_text': footnote_text,
+                'site_url': url
+            }
+        return list(footnotes.values())
+
     def scrape_all(self) -> Dict[str, Tuple[List[Dict], List[Dict]]]:
         """
         Execute comprehensive scraping of all available labor law information.
@@ -155,33 +495,8 @@ class ExtraInfoScraper:
         """
         logger.info("Initiating comprehensive labor law information extraction")
         
-        results = {}
-        
         try:
-            logger.info("Extracting paid rest period regulations")
-            results['rest_periods'] = self.extract_paid_rest_period()
-            
-            print(" Extracting meal breaks...")
-            results['meal_breaks'] = self.extract_meal_breaks()
-            
-            print(" Extracting dollar thresholds...")
-            results['dollar_threshold'] = self.extract_dollar_threshold()
-            
-            print(" Extracting payday requirements...")
-            results['payday'] = self.extract_payday_requirement()
-            
-            print(" Extracting child labor (non-farm)...")
-            results['child_labor_non_farm'] = self.extract_child_non_farm()
-            
-            print(" Extracting child labor (farm)...")
-            results['child_labor_farm'] = self.extract_child_farm()
-            
-            print(" Extracting child entertainment laws...")
-            results['child_entertainment'] = self.extract_child_entertainment()
-            
-            print(" Extracting door-to-door sales regulations...")
-            results['door_to_door_sales'] = self.extract_door_to_door_sales()
-            
+            results = dict(self.iter_all())
             print("✅ Extraction completed successfully!")
             
         except Exception as e:
@@ -190,56 +505,122 @@ class ExtraInfoScraper:
         
         return results
 
+    def iter_all(self) -> Iterator[Tuple[str, Tuple[List[Dict], List[Dict]]]]:
+        """
+        Run the extractors on a thread pool and yield the results in a fixed order.
+        
+        Each extractor fetches and parses its own page, so network waits
+        overlap instead of adding up; results are yielded in declaration
+        order as each one becomes available. At most MAX_EXTRACTOR_WORKERS
+        extractors are in flight, a page's cached bytes, soup and tree are
+        dropped when its extractor finishes, and a result is no longer
+        referenced here once it has been yielded.
+        
+        Yields
+        ------
+        Tuple[str, Tuple[List[Dict], List[Dict]]]
+            Regulatory data type and its (state_regulations, associated_footnotes)
+        """
+        extractors = (
+            ('rest_periods', "paid rest period regulations", self.extract_paid_rest_period),
+            ('meal_breaks', "meal breaks", self.extract_meal_breaks),
+            ('dollar_threshold', "dollar thresholds", self.extract_dollar_threshold),
+            ('payday', "payday requirements", self.extract_payday_requirement),
+            ('child_labor_non_farm', "child labor (non-farm)", self.extract_child_non_farm),
+            ('child_labor_farm', "child labor (farm)", self.extract_child_farm),
+            ('child_entertainment', "child entertainment laws", self.extract_child_entertainment),
+            ('door_to_door_sales', "door-to-door sales regulations", self.extract_door_to_door_sales),
+        )
+        
+        self.warmup()
+        
+        remaining = iter(extractors)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=MAX_EXTRACTOR_WORKERS) as executor:
+            def submit_next() -> None:
+                item = next(remaining, None)
+                if item is not None:
+                    data_type, label, extractor = item
+                    pending.append((data_type, label, executor.submit(self._run_extractor, extractor)))
+            
+            for _ in range(MAX_EXTRACTOR_WORKERS):
+                submit_next()
+            
+            while pending:
+                data_type, label, future = pending.popleft()
+                result = future.result()
+                del future
+                submit_next()
+                logger.info(f"Extracted {label}")
+                yield data_type, result
+                del result
+
+    def save_jsonl(
+        self,
+        path: str,
+        results: Optional[Iterable[Tuple[str, Tuple[List[Dict], List[Dict]]]]] = None
+    ) -> int:
+        """
+        Write scraped documents to a JSON Lines file, one document per line.
+        
+        Parameters
+        ----------
+        path : str
+            Destination file path
+        results : Iterable, optional
+            Pairs of (data_type, (state_docs, footnote_docs)), such as
+            ``scrape_all().items()``. When omitted, the extractors are run
+            through ``iter_all`` and each result is written as soon as it is
+            yielded, so only the extractors in flight hold pages and results
+            
+        Returns
+        -------
+        int
+            Number of documents written
+        """
+        if results is None:
+            results = self.iter_all()
+        
+        count = 0
+        with open(path, 'wb') as fp:
+            for data_type, (state_docs, footnote_docs) in results:
+                # One buffered write per extractor instead of two per document
+                lines = [
+                    orjson.dumps({'data_type': data_type, 'doc_category': doc_category, **doc})
+                    for doc_category, docs in (('state', state_docs), ('footnote', footnote_docs))
+                    for doc in docs
+                ]
+                if lines:
+                    fp.write(b"\n".join(lines) + b"\n")
+                count += len(lines)
+        
+        logger.info(f"Wrote {count} documents to {path}")
+        return count
+
     def extract_paid_rest_period(self) -> Tuple[List[Dict], List[Dict]]:
         """Extracts paid rest period requirements by state."""
         url = f'{self.base_url}/rest-periods'
         table = self.get_table(url=url)[0]
         footnote_elements = self.get_footnotes(url)
         
-        def process_footnote():
-            footnotes = []
-            for el in footnote_elements:
-                if el.name == 'p':
-                    a_tag = el.find('a', attrs={'name': True})
-                    if a_tag:
-                        footnotes.append({
-                            'footnote_id': a_tag['name'][-1],
-                            'footnote_text': el.get_text(strip=True)[1:],
-                            'site_url': url
-                        })
-            return footnotes
-
-        footnote_dict = process_footnote()
+        footnote_dict = _parse_footnotes(footnote_elements, url, text_offset=1)
         
-        table.columns = [re.sub('[0-9/:]', '', column).strip() for column in table.columns]
-        table['State'] = table['State'].apply(lambda x: re.sub('[0-9]', '', x))
+        table.columns = table.columns.str.translate(_COL_STRIP).str.strip()
+        table['State'] = table['State'].str.translate(_DIGIT_STRIP)
 
         state_docs = []
-        for _, row in table.iterrows():
+        for row in table.to_dict(orient="records"):
             state = row["State"]
-            doc_text = f"""
-In {state}, adult employees in the private sector are entitled to {row["Basic Standard"]}.
-This regulation is established by {row["Prescribed By"]} and applies to {row["Coverage"]}.
-Additional notes: {row["Comments"]}.
-            """
             state_docs.append({
                 "state": state,
-                "text": doc_text.strip(),
+                "text": _REST_TEMPLATE.format_map(row),
                 "type": "rest_period",
-                "topic": "Minimum Paid Rest Period Requirements Under State Law for Adult Employees in Private Sector",
+                "topic": _REST_TOPIC,
                 "site_url": url
             })
 
-        footnote_docs = [
-            {
-                "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
-                "type": "footnote",
-                "topic": "Minimum Paid Rest Period Requirements Under State Law for Adult Employees in Private Sector",
-                "id": fn["footnote_id"],
-                "site_url": fn["site_url"]
-            }
-            for fn in footnote_dict
-        ]
+        footnote_docs = _footnote_docs(footnote_dict, _REST_TOPIC)
         
         return state_docs, footnote_docs
 
@@ -249,53 +630,24 @@ Additional notes: {row["Comments"]}.
         table = self.get_table(url=url)[0]
         footnote_elements = self.get_footnotes(url)
         
-        def process_footnote():
-            footnotes = []
-            for el in footnote_elements:
-                if el.name == 'p':
-                    a_tag = el.find('a', attrs={'name': True})
-                    if a_tag:
-                        footnotes.append({
-                            'footnote_id': a_tag['name'][-1],
-                            'footnote_text': el.get_text(strip=True)[2:],
-                            'site_url': url
-                        })
-            return footnotes
+        footnote_dict = _parse_footnotes(footnote_elements, url, text_offset=2)
         
-        footnote_dict = process_footnote()
-        
-        table.columns = [re.sub('[0-9/:]', '', column).strip() for column in table.columns]
-        table['Jurisdiction'] = table['Jurisdiction'].apply(
-            lambda x: re.sub(r'[0-9]', '', str(x)) if pd.notna(x) else ''
+        table.columns = table.columns.str.translate(_COL_STRIP).str.strip()
+        table['Jurisdiction'] = (
+            table['Jurisdiction'].fillna('').astype(str).str.translate(_DIGIT_STRIP)
         )
         
         state_docs = []
-        for _, row in table.iterrows():
-            state_text = f"""
-In {row["Jurisdiction"]}, meal periods for adult employees in the private sector are regulated by state law.
-The standard is: {row["Basic Standard"]}.
-Prescribed by: {row["Prescribed By"]}.
-Coverage: {row["Coverage"]}.
-Comments: {row["Comments"]}.
-            """
+        for row in table.to_dict(orient="records"):
             state_docs.append({
                 "state": row["Jurisdiction"],
-                "text": state_text.strip(),
+                "text": _MEAL_TEMPLATE.format_map(row),
                 "type": "meal_period",
-                "topic": "Meal Period Requirements Under State Law",
+                "topic": _MEAL_TOPIC,
                 "site_url": url
             })
             
-        footnote_docs = [
-            {
-                "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
-                "type": "footnote",
-                "topic": "Meal Period Requirements Under State Law",
-                "id": fn["footnote_id"],
-                "site_url": fn["site_url"]
-            }
-            for fn in footnote_dict
-        ]
+        footnote_docs = _footnote_docs(footnote_dict, _MEAL_TOPIC)
         
         return state_docs, footnote_docs
     
@@ -305,50 +657,22 @@ Comments: {row["Comments"]}.
         table = self.get_table(url=url)[0]
         footnote_elements = self.get_footnotes(url)
 
-        def process_footnote():
-            footnotes = []
-            for el in footnote_elements:
-                if el.name == 'p':
-                    a_tag = el.find('a', attrs={'name': True})
-                    if a_tag:
-                        footnotes.append({
-                            'footnote_id': a_tag['name'][-1],
-                            'footnote_text': el.get_text(strip=True)[2:],
-                            'site_url': url
-                        })
-            return footnotes
-        
-        footnote_dict = process_footnote()
+        footnote_dict = _parse_footnotes(footnote_elements, url, text_offset=2)
         
-        table.columns = [re.sub('[0-9/:]', '', column).strip().capitalize() for column in table.columns]
-        table['State'] = table['State'].apply(lambda x: re.sub('[0-9]', '', x))
+        table.columns = table.columns.str.translate(_COL_STRIP).str.strip().str.capitalize()
+        table['State'] = table['State'].str.translate(_DIGIT_STRIP)
         
         state_docs = []
-        for _, row in table.iterrows():
-            state = row["State"]
-            threshold = row["Threshold amount"]
-            doc_text = f"""
-In {state}, the dollar threshold amount for contract coverage under state prevailing wage laws is {threshold}.
-This indicates the minimum contract value at which prevailing wage requirements apply to public works or government-funded projects in {state}.
-            """
+        for row in table.to_dict(orient="records"):
             state_docs.append({
-                "state": state,
-                "text": doc_text.strip(),
+                "state": row["State"],
+                "text": _THRESHOLD_TEMPLATE.format_map(row),
                 "type": "prevailing_wage",
-                "topic": "Dollar Threshold Amount for Contract Coverage Under State Prevailing Wage Laws",
+                "topic": _THRESHOLD_TOPIC,
                 "site_url": url
             })
 
-        footnote_docs = [
-            {
-                "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
-                "type": "footnote",
-                "topic": "Dollar Threshold Amount for Contract Coverage Under State Prevailing Wage Laws",
-                "id": fn["footnote_id"],
-                "site_url": fn["site_url"]
-            }
-            for fn in footnote_dict
-        ]
+        footnote_docs = _footnote_docs(footnote_dict, _THRESHOLD_TOPIC)
         
         return state_docs, footnote_docs
     
@@ -358,53 +682,23 @@ This indicates the minimum contract value at which prevailing wage requirements
         table = self.get_table(url=url)[0]
         footnote_elements = self.get_footnotes(url)
         
-        def process_footnote():
-            footnotes = []
-            for el in footnote_elements:
-                if el.name == 'p':
-                    a_tag = el.find('a', attrs={'name': True})
-                    if a_tag:
-                        footnotes.append({
-                            'footnote_id': a_tag['name'],
-                            'footnote_text': el.get_text(strip=True)[1:] if not a_tag['name'][-2].isnumeric() else el.get_text(strip=True)[2:],
-                            'site_url': url 
-                                
-                        })
-            return footnotes
-        
-        footnote_dict = process_footnote()
+        footnote_dict = _parse_footnotes(footnote_elements, url)
         
-        table.columns = [re.sub('[0-9/:]', '', column).strip().capitalize() for column in table.columns]
-        table['State'] = table['State'].apply(lambda x: re.sub('[0-9]', '', x))
+        table.columns = table.columns.str.translate(_COL_STRIP).str.strip().str.capitalize()
+        table['State'] = table['State'].str.translate(_DIGIT_STRIP)
         
         state_docs = []
-        for _, row in table.iterrows():
+        for row in table.to_dict(orient="records"):
             state = row["State"]
-            doc_text = f"""
-In {state}, the pay frequency requirements for private sector employers are as follows:
-- Weekly: {row.get('Weekly', 'N/A')}
-- Bi-weekly: {row.get('Bi-weekly', 'N/A')}
-- Semi-monthly: {row.get('Semi-monthly', 'N/A')}
-- Monthly: {row.get('Monthly', 'N/A')}.
-            """
             state_docs.append({
                 "state": state,
-                "text": doc_text.strip(),
+                "text": _PAYDAY_TEMPLATE.format_map({**_PAYDAY_DEFAULTS, **row}),
                 "type": "pay_frequency",
-                "topic": "Pay Frequency Requirements by State",
+                "topic": _PAYDAY_TOPIC,
                 "site_url": url
             })
 
-        footnote_docs = [
-            {
-                "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
-                "type": "footnote",
-                "topic": "Pay Frequency Requirements by State",
-                "id": fn["footnote_id"],
-
-            }
-            for fn in footnote_dict
-        ]
+        footnote_docs = _footnote_docs(footnote_dict, _PAYDAY_TOPIC)
 
         return state_docs, footnote_docs
     
@@ -412,8 +706,6 @@ In {state}, the pay frequency requirements for private sector employers are as f
         """Extracts child labor laws for non-farm employment by state."""
         url = f'{self.base_url}/child-labor'
         table = self.get_table(url=url)[0]
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, "html.parser")
         
         table.columns = [
             'State',
@@ -423,56 +715,20 @@ In {state}, the pay frequency requirements for private sector employers are as f
             'nightwork_16_17'
         ]
         
-        def process_footnote():
-            footnotes = []
-            for p in soup.find_all('p', id=lambda x: x and x.startswith('foot')):
-                a_tag = p.find('a', attrs={'name': True})
-                if a_tag and 'name' in a_tag.attrs:
-                    footnote_id = a_tag['name'][-1]
-                    full_text = p.get_text(strip=True)
-                    
-                    if full_text[0].lower() in ['a', 'b', 'c']:
-                        footnote_text = full_text[1:].strip()
-                    else:
-                        footnote_text = full_text
-                    
-                    footnotes.append({
-                        'footnote_id': footnote_id,
-                        'footnote_text': footnote_text,
-                        'site_url': url
-                    })
-            return footnotes
-        
-        footnote_dict = process_footnote()
+        footnote_dict = self._extract_foot_paragraphs(url)
 
         state_docs = []
-        for _, row in table.iterrows():
+        for row in table.to_dict(orient="records"):
             state = row["State"]
-            doc_text = f"""
-In {state}, child labor laws define the following limitations for minors in Non-farm Employment:
-- Maximum daily and weekly hours (Under 16): {row['max_daily_weekly_under16']}
-- Maximum daily and weekly hours (Ages 16 and 17): {row['max_daily_weekly_16_17']}
-- Nightwork prohibited (Under 16): {row['nightwork_under16']}
-- Nightwork prohibited (Ages 16 and 17): {row['nightwork_16_17']}.
-            """
             state_docs.append({
                 "state": state,
-                "text": doc_text.strip(),
+                "text": _CHILD_NON_FARM_TEMPLATE.format_map(row),
                 "type": "child_labor",
-                "topic": "Child Labor State Laws and Restrictions for Minors",
+                "topic": _CHILD_NON_FARM_TOPIC,
                 "site_url": url
             })
 
-        footnote_docs = [
-            {
-                "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
-                "type": "footnote",
-                "topic": "Child Labor State Laws and Restrictions for Minors",
-                "id": fn["footnote_id"],
-                "site_url": fn["site_url"]
-            }
-            for fn in footnote_dict
-        ]
+        footnote_docs = _footnote_docs(footnote_dict, _CHILD_NON_FARM_TOPIC)
         
         return state_docs, footnote_docs
     
@@ -499,92 +755,32 @@ In {state}, child labor laws define the following limitations for minors in Non-
             'dangerous_occupation_prohibited_age'
         ]
         
-        footnote_elements = self.get_footnotes(url)
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, "html.parser")
-        
-        def process_footnote():
-            footnotes = []
-            
-            for p in soup.find_all('p', id=lambda x: x and x.startswith('foot')):
-                a_tag = p.find('a', attrs={'name': True})
-                if a_tag and 'name' in a_tag.attrs:
-                    footnote_id = a_tag['name'][-1]
-                    full_text = p.get_text(strip=True)
-                    
-                    if full_text[0].lower() in ['a', 'b', 'c']:
-                        footnote_text = full_text[1:].strip()
-                    else:
-                        footnote_text = full_text
-                    
-                    footnotes.append({
-                        'footnote_id': footnote_id,
-                        'footnote_text': footnote_text,
-                        'site_url': url
-                    })
-            
-            for el in footnote_elements:
-                if el.name == 'p':
-                    a_tag = el.find('a', attrs={'name': True})
-                    if a_tag:
-                        footnotes.append({
-                            'footnote_id': a_tag['name'],
-                            'footnote_text': el.get_text(strip=True)[1:] if not a_tag['name'][-2].isnumeric() else el.get_text(strip=True)[2:],
-                            'site_url': url 
-                                
-                        })
-            return footnotes
-        
-        footnote_dict = process_footnote()
+        # The <p id="foot*"> paragraphs are the single source of footnotes here
+        footnote_dict = self._extract_foot_paragraphs(url)
 
         state_docs = []
         
-        for _, row in min_age_max_hour_req.iterrows():
+        for row in min_age_max_hour_req.to_dict(orient="records"):
             state = row["State"]
-            doc_text = f"""
-In {state}, child labor laws applicable to agricultural employment establish the following conditions:
-- Minimum age during school hours: {row['min_age_during_school']}
-- Minimum age outside school hours: {row['min_age_outside_school']}
-- Certificate required for employment: {row['employment_required_certificate']}
-- Certificate required for age: {row['age_required_certificate']}
-- Maximum daily/weekly hours for minors under 16: {row['max_daily_week_for_under_16']}
-- Maximum days per week for minors under 16: {row['max_day_per_week_for_under_16']}.
-            """
             state_docs.append({
                 "state": state,
-                "text": doc_text.strip(),
+                "text": _CHILD_FARM_TEMPLATE.format_map(row),
                 "type": "child_labor_agriculture",
-                "topic": "State Child Labor Laws Applicable to Agricultural Employment",
+                "topic": _CHILD_FARM_TOPIC,
                 "site_url": url
             })
         
-        for _, row in dangerous.iterrows():
+        for row in dangerous.to_dict(orient="records"):
             state = row["State"]
-            doc_text = f"""
-In {state}, additional child labor restrictions apply to agricultural work involving hazardous occupations:
-- Agricultural work prohibited for minors under 16 unless specific conditions apply: {row['prohibited_for_under_16_unless_other_age']}.
-- Minimum age for engagement in hazardous agricultural occupations: {row['dangerous_occupation_prohibited_age']}.
-
-These provisions ensure that minors are protected from hazardous agricultural tasks and environments, in accordance with state labor laws.
-            """
             state_docs.append({
                 "state": state,
-                "text": doc_text.strip(),
+                "text": _CHILD_FARM_HAZARDOUS_TEMPLATE.format_map(row),
                 "type": "child_labor_agriculture_hazardous",
-                "topic": "Hazardous Agricultural Occupations Restrictions for Minors Under State Law",
+                "topic": _CHILD_FARM_HAZARDOUS_TOPIC,
                 "site_url": url
             })
             
-        footnote_docs = [
-            {
-                "text": f"Footnote ({fn['footnote_id']}): {fn['footnote_text']}",
-                "type": "footnote",
-                "topic": "State Child Labor Laws Applicable to Agricultural Employment",
-                "id": fn["footnote_id"],
-                "site_url": fn["site_url"]
-            }
-            for fn in footnote_dict
-        ]
+        footnote_docs = _footnote_docs(footnote_dict, _CHILD_FARM_TOPIC)
         
         return state_docs, footnote_docs
     
@@ -594,25 +790,12 @@ These provisions ensure that minors are protected from hazardous agricultural ta
         table = self.get_table(url=url)[0]
         
         state_docs = []
-        for _, row in table.iterrows():
-            state = row["STATE"]
-            regulates = row["REGULATES CHILD ENTERTAINMENT"]
-            work_permit = row["WORK PERMIT"]
-            law_comment = row["LAW/COMMENT"]
-            
-            doc_text = f"""
-In {state}, child entertainment employment is subject to state law as follows:
-- Regulates child entertainment: {regulates}.
-- Work permit required: {work_permit}.
-- Additional comments / legal reference: {law_comment}.
-
-These provisions reflect {state}'s approach to permitting minors to work as actors, models or performers in the entertainment industry, and the accompanying safeguards regarding schooling, welfare and safety.
-            """
+        for row in table.to_dict(orient="records"):
             state_docs.append({
-                "state": state,
-                "text": doc_text.strip(),
+                "state": row["STATE"],
+                "text": _ENTERTAINMENT_TEMPLATE.format_map(row),
                 "type": "child_entertainment",
-                "topic": "State Child Entertainment Employment Laws for Minors",
+                "topic": _ENTERTAINMENT_TOPIC,
                 "site_url": url
             })
         
@@ -621,8 +804,7 @@ These provisions reflect {state}'s approach to permitting minors to work as acto
     def extract_door_to_door_sales(self) -> Tuple[List[Dict], List[Dict]]:
         """Extracts door-to-door sales regulations for minors by state."""
         url = f'{self.base_url}/child-labor/door-to-door-sales'
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self._get_soup(url)
         
         content = soup.find("div", id="content")
         if not content:
@@ -644,24 +826,26 @@ These provisions reflect {state}'s approach to permitting minors to work as acto
                     state_tag = li.find('strong')
                     if state_tag:
                         state = state_tag.get_text(strip=True)
-                        full_text = li.get_text(strip=True)
-                        
-                        details = full_text.replace(state, '', 1).strip()
+                        # Details are whatever follows the state's <strong> tag
+                        details = ''.join(
+                            sibling.get_text(strip=True) if isinstance(sibling, Tag) else sibling.strip()
+                            for sibling in state_tag.next_siblings
+                        ).strip()
                         if details.startswith('-'):
                             details = details[1:].strip()
                         
-                        doc_text = f"""
-State: {state.strip()}
-Category: {current_category}
-Regulation Details: {details}
-                        """
+                        doc_text = _DOOR_TO_DOOR_TEMPLATE.format_map({
+                            'state': state.strip(),
+                            'category': current_category,
+                            'details': details
+                        })
                         
                         state_docs.append({
                             "state": state,
                             "text": doc_text.strip(),
                             "type": "door_to_door_sales",
                             "category": current_category,
-                            "topic": "State Regulation of For-profit Door-to-door Sales by Minors"
+                            "topic": _DOOR_TO_DOOR_TOPIC
                         })
         
         return state_docs, []
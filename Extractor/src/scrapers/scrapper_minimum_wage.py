@@ -8,17 +8,17 @@ and associated footnotes/annotations.
 
 import logging
 import re
-import sys
 import warnings
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-sys.path.append('..')
 from config import BASE_URL_MINIMUM_WAGE, REQUEST_TIMEOUT, STATE_MIN_WAGE_URL
 
+from .http_session import get_session
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -29,6 +29,20 @@ logging.basicConfig(
 # Suppress non-critical warnings
 warnings.filterwarnings('ignore')
 
+# Footnote paragraphs look like "[1] text" or "(a) text"
+_FOOTNOTE_LINE_RE = re.compile(r'^[\[\(]\s*(?P<id>[^\)\]\s]+)[\)\]]\s*(?P<text>.+)')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_YEAR_RE = re.compile(r'^\d{4}$')
+
+# The wage tables and their footnotes live in the page's content div
+CONTENT_STRAINER = SoupStrainer("div", id="content")
+
+
+def _child_cells(row, name: str) -> List:
+    """Return the direct child cells of a table row with the given tag name."""
+    return [cell for cell in row.children if cell.name == name]
+
+
 class MinimumWageScraper:
     """
     Web scraper for standard minimum wage data extraction.
@@ -51,7 +65,38 @@ class MinimumWageScraper:
         self.url = url
         self.soup = None
         self.footnotes_dict = {}
+        # Pooled, disk-cached session shared with the other DOL scrapers
+        self.session = get_session()
+        self._soup_cache: Dict[Tuple[str, Optional[SoupStrainer]], BeautifulSoup] = {}
+
+    def _get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Return the parsed page for a URL, fetching and parsing it at most once.
         
+        Parameters
+        ----------
+        url : str
+            Full URL of the Department of Labor page
+        parse_only : SoupStrainer, optional
+            Restricts parsing to the matching subtree
+            
+        Returns
+        -------
+        BeautifulSoup
+            Parsed page, shared by later calls for the same URL and strainer
+            
+        Raises
+        ------
+        requests.RequestException
+            If the page cannot be retrieved
+        """
+        key = (url, parse_only)
+        if key not in self._soup_cache:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            self._soup_cache[key] = BeautifulSoup(response.content, 'lxml', parse_only=parse_only)
+        return self._soup_cache[key]
+
     def fetch_page(self) -> bool:
         """
         Retrieve and parse the HTML content from the target URL.
@@ -63,9 +108,7 @@ class MinimumWageScraper:
             False otherwise
         """
         try:
-            response = requests.get(self.url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            self.soup = BeautifulSoup(response.content, 'html.parser')
+            self.soup = self._get_soup(self.url, parse_only=CONTENT_STRAINER)
             logger.debug("Page fetched and parsed successfully")
             return True
         except requests.RequestException as e:
@@ -82,9 +125,7 @@ class MinimumWageScraper:
             DataFrame with columns ['state', 'basic_minimum_wage']
         """
         try:
-            response = requests.get(STATE_MIN_WAGE_URL, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._get_soup(STATE_MIN_WAGE_URL)
         except Exception as e:
             logger.error("Failed to retrieve State Minimum Wage page: %s", e)
             return pd.DataFrame()
@@ -138,10 +179,9 @@ class MinimumWageScraper:
 
         footnotes = {}
         # Look for paragraphs that start with a bracketed id like "[1] text" or "(1) text"
-        pattern = re.compile(r'^[\[\(]\s*(?P<id>[^\)\]\s]+)[\)\]]\s*(?P<text>.+)')
         for p in container.find_all('p'):
             txt = p.get_text(strip=True)
-            m = pattern.match(txt)
+            m = _FOOTNOTE_LINE_RE.match(txt)
             if m:
                 fid = m.group('id')
                 ftext = m.group('text').replace('- ', '').strip()
@@ -168,29 +208,31 @@ class MinimumWageScraper:
             if not rows:
                 continue
 
-            # Extract header cells; skip the first header cell (state label)
-            header = rows[0]
-            ths = header.find_all('th')
+            # Extract header cells; skip the first header cell (state label).
+            # Tables without a <th> header row are not wage tables
+            ths = _child_cells(rows[0], 'th')
+            if not ths:
+                continue
             # Build year labels cleaning non-digit characters; keep original if not a year
             years = []
             for th in ths[1:]:
                 txt = th.get_text(strip=True)
-                y = re.sub(r'[^0-9]', '', txt)
+                y = _NON_DIGIT_RE.sub('', txt)
                 years.append(y if y else txt)
 
-            # Extract data rows
+            # Extract data rows, reading only each row's own <td> children; the
+            # column check runs on the first row so mismatched tables stop early
             states = []
             for state_row in rows[1:]:
-                tds = state_row.find_all('td')
-                states.append([td.get_text(strip=True) for td in tds])
-
-            # If row length doesn't match, skip this table
-            if states and len(states[0]) != len(years) + 1:
-                logger.debug("Skipping table due to column mismatch: expected %d, got %d", len(years) + 1, len(states[0]))
-                continue
+                states.append([td.get_text(strip=True) for td in _child_cells(state_row, 'td')])
 
-            df = pd.DataFrame(states, columns=['state'] + years)
-            df_list.append(df)
+                # If row length doesn't match, skip this table
+                if len(states) == 1 and len(states[0]) != len(years) + 1:
+                    logger.debug("Skipping table due to column mismatch: expected %d, got %d", len(years) + 1, len(states[0]))
+                    break
+            else:
+                df = pd.DataFrame(states, columns=['state'] + years)
+                df_list.append(df)
 
         logger.debug("Extracted %d tables from page", len(df_list))
         return df_list
@@ -203,15 +245,22 @@ class MinimumWageScraper:
         returning a mapping of cleaned column -> footnote id.
         """
         # columns that are not plain year columns (YYYY) and not the state column
-        columns_to_adjust = [col for col in df.columns if not re.match(r'^\d{4}$', str(col)) and col != 'state']
+        columns_to_adjust = [col for col in df.columns if not _YEAR_RE.match(str(col)) and col != 'state']
+        column_names = [(col, str(col)) for col in columns_to_adjust]
         footnote_year_bridge: Dict[str, str] = {}
-
-        for key in list(self.footnotes_dict.keys()):
-            for col in columns_to_adjust:
-                if str(key) in str(col):
-                    clean_col = str(col).replace(str(key), '').strip()
-                    footnote_year_bridge[clean_col] = str(key)
-                    df = df.rename(columns={col: clean_col})
+        renames: Dict = {}
+
+        for key in map(str, self.footnotes_dict):
+            for col, col_name in column_names:
+                if key in col_name:
+                    clean_col = col_name.replace(key, '').strip()
+                    footnote_year_bridge[clean_col] = key
+                    # The first matching footnote decides the new column name
+                    renames.setdefault(col, clean_col)
+
+        # A single rename instead of copying the frame once per match
+        if renames:
+            df = df.rename(columns=renames)
 
         logger.debug("Processed footnote columns, mappings: %s", footnote_year_bridge)
         return df, footnote_year_bridge
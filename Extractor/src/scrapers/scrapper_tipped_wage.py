@@ -11,18 +11,19 @@ wage regulations from the U.S. Department of Labor website. It handles:
 
 import logging
 import re
-import sys
 import warnings
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
 
-sys.path.append('..')
 from config import (BASE_URL_TIPPED_WAGE, REQUEST_TIMEOUT,
                 TIPPED_WAGE_END_YEAR, TIPPED_WAGE_START_YEAR)
 
+from .http_session import get_session
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -33,6 +34,12 @@ logging.basicConfig(
 # Suppress non-critical warnings
 warnings.filterwarnings('ignore')
 
+# Jurisdiction names keep only letters, digits and whitespace
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+# The tip table and its footnote paragraphs live in the page's content div
+CONTENT_STRAINER = SoupStrainer("div", id="content")
+
 class TippedWageScraper:
     """
     Web scraper specialized for tipped employee wage regulations.
@@ -63,6 +70,11 @@ class TippedWageScraper:
             'definition'   # State-specific definitions
         ]
         self.footnotes_dict = {}
+        # Pooled, disk-cached session shared with the other DOL scrapers, so the
+        # per-year requests reuse connections and past years are not re-downloaded
+        self.session = get_session()
+        self._soup_cache: Dict[Tuple[str, Optional[SoupStrainer]], BeautifulSoup] = {}
+        self._footnotes_cache: Dict[str, Dict[str, str]] = {}
     
     def extract_footnotes(self, soup: BeautifulSoup) -> Dict[str, str]:
         """
@@ -98,89 +110,134 @@ class TippedWageScraper:
         logger.debug("Extracted %d footnotes for tipped wages", len(footnotes_dict))
         return footnotes_dict
     
-    def processar_celula_valor(self, td_element, column_name: str, footnotes_dict: Dict) -> Tuple[Optional[str], List[str]]:
+    @staticmethod
+    def textos_visiveis(element: Tag, ignorar: Tuple[str, ...]) -> List[str]:
+        """Collect the text nodes of an element, skipping the subtrees of ignored tags.
+
+        Works on the original tree, so cells no longer need to be copied and
+        re-parsed before links or labels are stripped out.
+        """
+        textos: List[str] = []
+        pendentes = [iter(element.children)]
+        while pendentes:
+            for node in pendentes[-1]:
+                if isinstance(node, Tag):
+                    if node.name not in ignorar:
+                        pendentes.append(iter(node.children))
+                        break
+                elif type(node) in (NavigableString, CData):
+                    textos.append(str(node))
+            else:
+                pendentes.pop()
+        return textos
+
+    @staticmethod
+    def extrair_footnote_refs(td_element) -> List[str]:
+        """Return the footnote ids linked from a cell, e.g. href="#foot1" -> "foot1"."""
+        footnote_refs: List[str] = []
+        for link in td_element.find_all('a', href=True):
+            # Inline footnote links point at a "#footN" fragment
+            _, sep, fragment = link.get('href').rpartition('#')
+            if sep and fragment.startswith('foot') and fragment[4:].isdigit():
+                footnote_refs.append(fragment)
+        return footnote_refs
+
+    def processar_celula_valor(self, td_element, column_name: str, footnotes_dict: Dict,
+                               footnote_refs: Optional[List[str]] = None) -> Tuple[Optional[str], List[str]]:
         """Extract a cleaned value and any footnote refs from a table cell.
 
+        Pass footnote_refs when the cell's links were already scanned.
         Returns a tuple (value_or_none, list_of_footnote_ids).
         """
         if not td_element:
             return None, []
 
-        # Find inline footnote links like href="#foot1"
-        footnote_refs: List[str] = []
-        for link in td_element.find_all('a', href=True):
-            href = link.get('href')
-            if href:
-                match = re.search(r'#(foot\d+)', href)
-                if match:
-                    footnote_refs.append(match.group(1))
-
-        # Remove links and extract visible text
-        soup_copy = BeautifulSoup(str(td_element), 'html.parser')
-        for link in soup_copy.find_all('a'):
-            link.decompose()
+        if footnote_refs is None:
+            footnote_refs = self.extrair_footnote_refs(td_element)
 
         # If the cell includes strong markup we treat it as a header/label, not a value
-        if soup_copy.find('strong'):
+        if td_element.find('strong'):
             return None, footnote_refs
 
-        valor = ' '.join(soup_copy.get_text().split())
+        # Visible text without the link markers
+        valor = ' '.join(''.join(self.textos_visiveis(td_element, ('a',))).split())
         return valor if valor else None, footnote_refs
 
-    def processar_jurisdiction(self, td_element, footnotes_dict: Dict) -> Tuple[Optional[str], List[str], str]:
+    def processar_jurisdiction(self, td_element, footnotes_dict: Dict,
+                               footnote_refs: Optional[List[str]] = None) -> Tuple[Optional[str], List[str], str]:
         """Extract a cleaned jurisdiction name, footnote refs and extra text.
 
+        Pass footnote_refs when the cell's links were already scanned.
         Returns (name_or_none, list_of_footnote_refs, extra_text).
         """
         if not td_element:
             return None, [], ""
 
-        # Extract inline footnote links
-        footnote_refs: List[str] = []
-        for link in td_element.find_all('a', href=True):
-            href = link.get('href')
-            if href:
-                match = re.search(r'#(foot\d+)', href)
-                if match:
-                    footnote_refs.append(match.group(1))
-
-        soup_copy = BeautifulSoup(str(td_element), 'html.parser')
-        first_strong = soup_copy.find('strong')
+        if footnote_refs is None:
+            footnote_refs = self.extrair_footnote_refs(td_element)
+
+        first_strong = td_element.find('strong')
         if first_strong:
-            nome_limpo = re.sub(r'[^a-zA-Z0-9\s]', '', first_strong.get_text(strip=True))
+            nome_limpo = _NON_ALNUM_RE.sub('', first_strong.get_text(strip=True))
         else:
-            nome_limpo = soup_copy.get_text(strip=True)
+            nome_limpo = td_element.get_text(strip=True)
 
-        # Remove strong and anchor tags to isolate remaining explanatory text
-        for tag in soup_copy.find_all(['strong', 'a']):
-            tag.decompose()
-
-        other_extra_text = ' '.join(soup_copy.get_text(strip=True).split())
+        # Skip strong and anchor tags to isolate remaining explanatory text
+        extra_text = ''.join(
+            text.strip() for text in self.textos_visiveis(td_element, ('strong', 'a'))
+        )
+        other_extra_text = ' '.join(extra_text.split())
         return nome_limpo, footnote_refs, other_extra_text
 
 
 
-    def extract_table_for_year(self, year: int, url:str =None) -> pd.DataFrame:
-        """Extrai tabela de um ano específico"""
+    def _get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Return the parsed page for a URL, fetching and parsing it at most once.
+        
+        Parameters
+        ----------
+        url : str
+            Full URL of the Department of Labor page
+        parse_only : SoupStrainer, optional
+            Restricts parsing to the matching subtree
+            
+        Returns
+        -------
+        BeautifulSoup
+            Parsed page, shared by later calls for the same URL and strainer
+            
+        Raises
+        ------
+        requests.RequestException
+            If the page cannot be retrieved
+        """
+        key = (url, parse_only)
+        if key not in self._soup_cache:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            self._soup_cache[key] = BeautifulSoup(response.content, 'lxml', parse_only=parse_only)
+        return self._soup_cache[key]
+
+    def extract_rows_for_year(self, year: int, url: str = None) -> List[Dict]:
+        """Extrai as linhas da tabela de um ano específico como dicts"""
         if url is None:
             url = f'{self.base_url}/{year}'
         
         try:
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
+            soup = self._get_soup(url, parse_only=CONTENT_STRAINER)
         except requests.RequestException as e:
             logger.warning("Failed to fetch tipped wage page for %s: %s", year, e)
-            return pd.DataFrame()
+            return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extrair footnotes
-        footnotes = self.extract_footnotes(soup)
-        self.footnotes_dict[year] = footnotes
+        # Extrair footnotes (uma vez por URL)
+        if url not in self._footnotes_cache:
+            self._footnotes_cache[url] = self.extract_footnotes(soup)
+        self.footnotes_dict[year] = self._footnotes_cache[url]
         # Processar tabela
         tip_table = soup.find('table')
         if not tip_table:
-            return pd.DataFrame()
+            return []
         
         tip_linhas = tip_table.find_all('tr')[1:]
 
@@ -199,13 +256,17 @@ class TippedWageScraper:
                 continue
 
             td_jurisdiction = tr.find('td', headers='jurisdiction')
+            # Links da célula de jurisdição são lidos uma vez e reaproveitados abaixo
+            refs_jurisdiction = (
+                self.extrair_footnote_refs(td_jurisdiction) if td_jurisdiction else None
+            )
             todas_notas = []
-            all_footnote_refs: List[str] = []
+            all_footnote_refs: Set[str] = set()  # Sem duplicatas
             all_footnote_texts = []
 
             if td_jurisdiction and td_jurisdiction.find('strong'):
                 jurisdiction_limpa, footnote_refs, note_text = self.processar_jurisdiction(
-                    td_jurisdiction, self.footnotes_dict
+                    td_jurisdiction, self.footnotes_dict, footnote_refs=refs_jurisdiction
                 )
                 ultima_jurisdiction = jurisdiction_limpa
                 ultima_footnote_refs = footnote_refs
@@ -214,12 +275,12 @@ class TippedWageScraper:
                 row_data['jurisdiction'] = jurisdiction_limpa
 
                 if footnote_refs:
-                    all_footnote_refs.extend(footnote_refs)
+                    all_footnote_refs.update(footnote_refs)
             else:
                 if ultima_jurisdiction:
                     row_data['jurisdiction'] = ultima_jurisdiction
                     if ultima_footnote_refs:
-                        all_footnote_refs.extend(ultima_footnote_refs)
+                        all_footnote_refs.update(ultima_footnote_refs)
 
             # Process column values
             for i, td in enumerate(tds):
@@ -228,7 +289,8 @@ class TippedWageScraper:
                     header_name = self.header_order[i]
 
                 valor_limpo, footnote_refs = self.processar_celula_valor(
-                    td, header_name, self.footnotes_dict
+                    td, header_name, self.footnotes_dict,
+                    footnote_refs=refs_jurisdiction if td is td_jurisdiction else None
                 )
                 if valor_limpo:
                     if header_name != 'jurisdiction':
@@ -236,16 +298,20 @@ class TippedWageScraper:
                     else:
                         row_data['notes'] = valor_limpo
                     if footnote_refs:
-                        all_footnote_refs.extend(footnote_refs)
+                        all_footnote_refs.update(footnote_refs)
 
             if all_footnote_refs:
-                row_data['footnotes'] = list(set(all_footnote_refs))  # Remove duplicatas
+                row_data['footnotes'] = list(all_footnote_refs)
 
             if row_data and any(v for k, v in row_data.items() if k not in ['jurisdiction', 'notes', 'footnotes']):
                 row_data['year'] = year
                 dados_tabela.append(row_data)
 
-        return pd.DataFrame(dados_tabela)
+        return dados_tabela
+
+    def extract_table_for_year(self, year: int, url:str =None) -> pd.DataFrame:
+        """Extrai tabela de um ano específico"""
+        return pd.DataFrame(self.extract_rows_for_year(year, url))
     
     def scrape(self, start_year: int = TIPPED_WAGE_START_YEAR, 
             end_year: int = TIPPED_WAGE_END_YEAR) -> pd.DataFrame:
@@ -253,32 +319,40 @@ class TippedWageScraper:
 
         Returns an empty DataFrame if no data is found or if recoverable errors occur.
         """
-        dfs: List[pd.DataFrame] = []
-        for year in range(start_year, end_year + 1):
-            df_year = self.extract_table_for_year(year)
-            if not df_year.empty:
-                dfs.append(df_year)
-                logger.info("Year %d: %d records", year, len(df_year))
+        rows: List[Dict] = []
+        years = range(start_year, end_year + 1)
+        # Years are independent pages; fetch them concurrently, keep year order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            year_rows = list(executor.map(self.extract_rows_for_year, years))
+        for year, linhas in zip(years, year_rows):
+            if linhas:
+                rows.extend(linhas)
+                logger.info("Year %d: %d records", year, len(linhas))
             else:
                 logger.debug("Year %d: no data", year)
         year = 2025
-        actual_df = self.extract_table_for_year(year=year, url="https://www.dol.gov/agencies/whd/state/minimum-wage/tipped")
-        if not actual_df.empty:
-            dfs.append(actual_df)
-            logger.info("Year %d: %d records", year, len(actual_df))
+        actual_rows = self.extract_rows_for_year(year=year, url="https://www.dol.gov/agencies/whd/state/minimum-wage/tipped")
+        if actual_rows:
+            rows.extend(actual_rows)
+            logger.info("Year %d: %d records", year, len(actual_rows))
         else:
             logger.debug("Year %d: no data", year)
+
+        # Todas as páginas já foram lidas; libera as árvores e footnotes em cache
+        self._soup_cache.clear()
+        self._footnotes_cache.clear()
             
-        if not dfs:
+        if not rows:
             logger.warning("No tipped wage data was extracted for %d..%d", start_year, end_year)
             return pd.DataFrame()
 
+        # Um único DataFrame a partir de todas as linhas, sem concat por ano
         try:
-            df_final = pd.concat(dfs, ignore_index=True)
+            df_final = pd.DataFrame.from_records(rows)
             logger.info("Tipped wage scraping completed: %d records", len(df_final))
             return df_final
         except Exception as e:
-            logger.error("Failed concatenating tipped wage tables: %s", e)
+            logger.error("Failed building tipped wage table: %s", e)
             return pd.DataFrame()
 
 
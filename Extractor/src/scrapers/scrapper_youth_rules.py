@@ -2,14 +2,18 @@
 Scraper melhorado para Youth Employment Rules
 Baseado na sua implementação, com melhorias adicionais
 """
+import functools
 import logging
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import pandas as pd
 import re
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 import warnings
 
+from .http_session import get_session
+
 warnings.filterwarnings('ignore')
 
 # Configure module logger
@@ -19,21 +23,60 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Consultas XPath compiladas, avaliadas pelo libxml2 em C
+_FIRST_TABLE = etree.XPath("(//table)[1]")
+_TABLE_ROWS = etree.XPath(".//tr")
+_ROW_TH = etree.XPath("(.//th)[1]")
+_TH_STRONG = etree.XPath("(.//strong)[1]")
+_ROW_TDS = etree.XPath(".//td")
+_TD_ANCHORS = etree.XPath(".//a[@href]")
+_NAMED_ANCHORS = etree.XPath("//a[@name]")
+# Nós que não fazem parte do texto visível da página
+_NON_TEXT_NODES = ("script", "style", "template", etree.Comment)
+
+# Padrões compilados uma única vez no import
+_YEAR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r'January\s+\d+,\s+(\d{4})', r'Updated:\s*(\d{4})', r'Revised:\s*(\d{4})', r'©\s*(\d{4})')
+)
+_FOOTNOTE_RE = re.compile(r'\[?(\d+)\]?\s+(.+?)(?=\s*\[?\d+\]?\s+|$)', re.DOTALL)
+_FOOTNOTE_PREFIX_RE = re.compile(r'^Footnote\s+\d+:\s*', re.IGNORECASE)
+_FOOT_ANCHOR_RE = re.compile(r'foot\d+')
+_FOOTNOTE_MARKER_RE = re.compile(r'^\[?\w+\]?\s*')
+_DIGITS_RE = re.compile(r'^\d+$')
+# Colunas dos registros de certificado, na ordem do DataFrame final
+YOUTH_RULE_COLUMNS = [
+    "state", "year", "certificate_type", "rule_description", "is_issued_by_labor",
+    "is_issued_by_school", "requirement_level", "age_min", "age_max", "notes",
+    "footnotes", "footnote_text"
+]
+
+# Marcas de requisito e seus níveis, na ordem de prioridade da detecção
+_REQUIREMENT_MARKS = (('(M)', 1), ('(R)', 2), ('(P)', 3))
+_REQUIREMENT_MARK_RE = re.compile(r'\s*\(M\)|\s*\(R\)|\s*\(P\)')
+_AGE_RE = re.compile(r'\b(\d{2})\b')
+
 class YouthEmploymentScraperImproved:
     """Scraper melhorado para Age Certificates"""
     
     def __init__(self, url: str = "https://www.dol.gov/agencies/whd/state/age-certificates"):
         self.url = url
-        self.soup = None
+        self.session = get_session()
+        self.tree = None
+        self.page_text = None
         self.footnotes_dict = {}
         self.year = None
     
     def fetch_page(self) -> bool:
         """Busca a página HTML"""
         try:
-            response = requests.get(self.url, timeout=30)
+            response = self.session.get(self.url, timeout=30)
             response.raise_for_status()
-            self.soup = BeautifulSoup(response.text, "html.parser")
+            parser = lxml_html.HTMLParser(encoding="utf-8")
+            self.tree = lxml_html.document_fromstring(response.content, parser=parser)
+            # Texto completo da página, lido por extract_year e extract_footnotes
+            etree.strip_elements(self.tree, *_NON_TEXT_NODES, with_tail=False)
+            self.page_text = ' '.join(self.tree.itertext())
             logger.debug("Fetched youth rules page")
             return True
         except requests.RequestException as e:
@@ -42,14 +85,13 @@ class YouthEmploymentScraperImproved:
     
     def extract_year(self) -> Optional[int]:
         """Extrai o ano dos dados"""
-        if not self.soup:
+        if self.tree is None:
             return None
 
         # Try a few patterns for a publication or revision year
-        text = self.soup.get_text(separator=' ')
-        patterns = [r'January\s+\d+,\s+(\d{4})', r'Updated:\s*(\d{4})', r'Revised:\s*(\d{4})', r'©\s*(\d{4})']
-        for pat in patterns:
-            match = re.search(pat, text, flags=re.IGNORECASE)
+        text = self.page_text
+        for pattern in _YEAR_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     self.year = int(match.group(1))
@@ -62,34 +104,33 @@ class YouthEmploymentScraperImproved:
     
     def extract_footnotes(self) -> Dict[str, str]:
         """Extrai footnotes completos da página"""
-        if not self.soup:
+        if self.tree is None:
             return {}
 
         # Prefer extracting footnotes from a dedicated section if present
-        text = self.soup.get_text(separator=' ')
+        text = self.page_text
         footnotes: Dict[str, str] = {}
 
         # Try to find a labelled Footnotes: section first
         if 'Footnotes:' in text:
             footnote_section = text.split('Footnotes:')[1]
-            pattern = r'\[?(\d+)\]?\s+(.+?)(?=\s*\[?\d+\]?\s+|$)'
-            matches = re.findall(pattern, footnote_section, re.DOTALL)
+            matches = _FOOTNOTE_RE.findall(footnote_section)
             for num, text_content in matches:
                 clean_text = ' '.join(text_content.split()).strip()
-                clean_text = re.sub(r'^Footnote\s+\d+:\s*', '', clean_text, flags=re.IGNORECASE)
+                clean_text = _FOOTNOTE_PREFIX_RE.sub('', clean_text)
                 if clean_text:
                     footnotes[num] = clean_text
 
         # Fallback: try to extract anchors that look like footnote markers
         if not footnotes:
-            for a in self.soup.find_all('a', attrs={'name': True}):
+            for a in _NAMED_ANCHORS(self.tree):
                 name = a.get('name')
-                if name and re.match(r'foot\d+', str(name)):
-                    parent = a.find_parent('p')
-                    if parent:
-                        txt = ' '.join(parent.get_text(separator=' ').split())
+                if name and _FOOT_ANCHOR_RE.match(str(name)):
+                    parent = next(a.iterancestors('p'), None)
+                    if parent is not None:
+                        txt = ' '.join(' '.join(parent.itertext()).split())
                         # remove marker text
-                        txt = re.sub(r'^\[?\w+\]?\s*', '', txt)
+                        txt = _FOOTNOTE_MARKER_RE.sub('', txt)
                         footnotes[name.replace('foot', '')] = txt
 
         self.footnotes_dict = footnotes
@@ -107,9 +148,7 @@ class YouthEmploymentScraperImproved:
             3 = Practice (P)
             None = Não especificado
         """
-        mapping = {'(M)': 1, '(R)': 2, '(P)': 3}
-        
-        for mark, level in mapping.items():
+        for mark, level in _REQUIREMENT_MARKS:
             if mark in text:
                 return level
         
@@ -118,12 +157,12 @@ class YouthEmploymentScraperImproved:
     @staticmethod
     def extract_text(td) -> str:
         """Extrai texto limpo de uma célula <td>."""
-        return '; '.join(part.strip() for part in td.stripped_strings)
+        return '; '.join(part.strip() for part in td.itertext() if part.strip())
     
     @staticmethod
     def remove_requirement_marks(text: str) -> str:
         """Remove marcas de requisito do texto."""
-        return re.sub(r'\s*\(M\)|\s*\(R\)|\s*\(P\)', '', text).strip()
+        return _REQUIREMENT_MARK_RE.sub('', text).strip()
     
     def detect_footnote(self, values: List) -> Optional[List[Dict]]:
         """
@@ -135,13 +174,14 @@ class YouthEmploymentScraperImproved:
         links: List[Dict] = []
 
         for idx, td in enumerate(values):
-            anchors = td.find_all("a", href=True)
+            anchors = _TD_ANCHORS(td)
             if anchors:
                 for a in anchors:
-                    href_text = a.get_text(strip=True)
-                    if re.match(r'^\d+$', href_text):
-                        # preserve a copy of the cell without the anchor
-                        a.decompose()
+                    href_text = ''.join(part.strip() for part in a.itertext())
+                    if _DIGITS_RE.match(href_text):
+                        # empty the anchor but keep it in place: the text after it
+                        # stays a separate string, as with BeautifulSoup's decompose
+                        a.clear(keep_tail=True)
                         links.append({
                             "href": href_text,
                             "index": idx,
@@ -163,7 +203,7 @@ class YouthEmploymentScraperImproved:
             return None, None
         
         # Extrair todos os números
-        ages = [int(n) for n in re.findall(r'\b(\d{2})\b', text)]
+        ages = [int(n) for n in _AGE_RE.findall(text)]
         
         if not ages:
             return None, None
@@ -179,18 +219,18 @@ class YouthEmploymentScraperImproved:
         """
         try:
             # Extrair jurisdiction
-            th = state_row.find('th')
+            th = _ROW_TH(state_row)
             if not th:
                 return None
             
-            strong = th.find('strong')
+            strong = _TH_STRONG(th[0])
             if not strong:
                 return None
             
-            jurisdiction = strong.get_text(strip=True)
+            jurisdiction = ''.join(part.strip() for part in strong[0].itertext())
             
             # Extrair células
-            values = state_row.find_all("td")
+            values = _ROW_TDS(state_row)
             
             if len(values) < 6:
                 return None
@@ -258,23 +298,22 @@ class YouthEmploymentScraperImproved:
             logger.warning("Error parsing state row: %s", e)
             return None
     
-    def attach_footnote_texts(self, data: List[Dict]) -> List[Dict]:
-        """Anexa textos completos dos footnotes aos registros (mantém coluna separada)"""
-        for record in data:
-            footnote_refs = record.get('footnotes')
+    def footnote_text_formatter(self) -> Callable[[Optional[List]], Optional[str]]:
+        """
+        Cria a função que monta o texto dos footnotes de uma lista de referências.
+        
+        Os textos "[ref] texto" são formatados uma vez, e o resultado por
+        combinação de referências é memorizado (muitas linhas repetem as mesmas).
+        """
+        formatted = {ref: f"[{ref}] {text}" for ref, text in self.footnotes_dict.items()}
 
-            if footnote_refs:
-                footnote_texts = []
-                for ref in footnote_refs:
-                    if str(ref) in self.footnotes_dict:
-                        footnote_texts.append(f"[{ref}] {self.footnotes_dict[str(ref)]}")
+        @functools.lru_cache(maxsize=None)
+        def join_refs(refs: Tuple) -> Optional[str]:
+            footnote_texts = [formatted[str(ref)] for ref in refs if str(ref) in formatted]
+            return ' | '.join(footnote_texts) if footnote_texts else None
 
-                record['footnote_text'] = ' | '.join(footnote_texts) if footnote_texts else None
-            else:
-                record['footnote_text'] = None
+        return lambda refs: join_refs(tuple(refs)) if refs else None
 
-        return data
-    
     def scrape(self) -> pd.DataFrame:
         """Executa o scraping completo"""
         logger.info("Starting Youth Employment Rules scraping: %s", self.url)
@@ -295,13 +334,13 @@ class YouthEmploymentScraperImproved:
             logger.warning("Footnote extraction failed: %s", e)
 
         # Locate the main table
-        table = self.soup.find("table")
-        if not table:
+        tables = _FIRST_TABLE(self.tree)
+        if not tables:
             logger.warning("No table found on youth rules page")
             return pd.DataFrame()
 
         # Skip header rows if present (robustly find data rows)
-        all_rows = table.find_all("tr")
+        all_rows = _TABLE_ROWS(tables[0])
         data_rows = all_rows[4:] if len(all_rows) > 6 else all_rows[1:]
         logger.info("Processing %d state rows", len(data_rows))
 
@@ -313,10 +352,11 @@ class YouthEmploymentScraperImproved:
 
         logger.info("Extracted %d youth employment records", len(youth_employment))
 
-        # Attach footnote texts
-        youth_employment = self.attach_footnote_texts(youth_employment)
+        # Colunas conhecidas: o pandas não precisa inferi-las de cada dict
+        df = pd.DataFrame.from_records(youth_employment, columns=YOUTH_RULE_COLUMNS)
 
-        df = pd.DataFrame(youth_employment)
+        # Attach footnote texts
+        df['footnote_text'] = df['footnotes'].map(self.footnote_text_formatter())
         logger.info("Scraping completed: %d records", len(df))
         return df
 
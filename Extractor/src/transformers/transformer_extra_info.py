@@ -1,8 +1,69 @@
 import psycopg2
-from psycopg2.extras import execute_values
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import hashlib
+import io
 import json
+import math
+
+
+EmbeddingsFunc = Callable[[List[str]], List[List[float]]]
+
+_DOCUMENT_COLUMNS = (
+    'doc_id', 'state', 'data_type', 'doc_category', 'topic', 'regulation_type',
+    'regulation_category', 'content', 'embedding', 'metadata'
+)
+_FOOTNOTE_COLUMNS = ('site_id', 'footnote_id', 'data_type', 'topic', 'content', 'embedding', 'metadata')
+
+# Session settings for the one-shot load: commits do not wait for the WAL
+# flush, and sorts and index builds get more memory
+_BULK_LOAD_SETTINGS = (
+    "SET synchronous_commit = off;",
+    "SET work_mem = '256MB';",
+    "SET maintenance_work_mem = '1GB';",
+)
+
+# ivfflat indexes, built by create_vector_indexes once the load is done
+_VECTOR_INDEXES = (
+    ('idx_documents_embedding', 'labor_law_documents'),
+    ('idx_footnotes_embedding', 'labor_law_footnotes'),
+)
+
+# Escapes of the COPY text format (NULL is written as \N)
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_field(value) -> str:
+    """
+    Format one value for COPY ... FROM STDIN in PostgreSQL text format.
+    
+    Args:
+        value: Column value; sequences are written as pgvector literals
+        
+    Returns:
+        Escaped field text
+    """
+    if value is None:
+        return '\\N'
+    if hasattr(value, 'tolist'):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        value = '[' + ','.join(str(x) for x in value) + ']'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def batched_embeddings(embed_one: Callable[[str], List[float]]) -> EmbeddingsFunc:
+    """
+    Adapt a per-text embedding function to the batched contract of the transformer.
+    
+    Args:
+        embed_one: Function mapping one text to its embedding vector
+        
+    Returns:
+        Function mapping a list of texts to their embedding vectors, in order
+    """
+    def embed_batch(texts: List[str]) -> List[List[float]]:
+        return [embed_one(text) for text in texts]
+    return embed_batch
 
 
 class ExtraInfoTransformer:
@@ -29,6 +90,13 @@ class ExtraInfoTransformer:
             print(f"❌ Error connecting to database: {e}")
             raise
     
+    def configure_bulk_load(self):
+        """Apply session settings that favor bulk-load throughput over per-commit durability."""
+        # The COPY stream carries raw UTF-8 text (metadata is not ASCII-escaped)
+        self.conn.set_client_encoding('UTF8')
+        for setting in _BULK_LOAD_SETTINGS:
+            self.cur.execute(setting)
+    
     def disconnect(self):
         """Close database connection."""
         if self.cur:
@@ -38,7 +106,12 @@ class ExtraInfoTransformer:
         print("✅ Database connection closed")
     
     def create_tables(self):
-        """Create necessary tables if they don't exist."""
+        """
+        Create necessary tables if they don't exist.
+        
+        Nothing is committed here: transform_and_insert commits the schema
+        changes together with the load, so a failed load rolls them back.
+        """
         print("\n📋 Creating tables...")
         
         try:
@@ -101,22 +174,11 @@ class ExtraInfoTransformer:
                 ON labor_law_documents(doc_category);
             """)
             
-            self.cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_documents_embedding 
-                ON labor_law_documents USING ivfflat (embedding vector_cosine_ops);
-            """)
-            
-            self.cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_footnotes_embedding 
-                ON labor_law_footnotes USING ivfflat (embedding vector_cosine_ops);
-            """)
-            
             self.cur.execute("""
                 CREATE INDEX IF NOT EXISTS idx_documents_metadata 
                 ON labor_law_documents USING gin(metadata);
             """)
 
-            self.conn.commit()
             print("✅ Tables created successfully")
 
         except Exception as e:
@@ -125,6 +187,33 @@ class ExtraInfoTransformer:
             raise
 
     
+    def drop_vector_indexes(self):
+        """Drop the ivfflat embedding indexes so the load does not maintain them row by row."""
+        for index_name, _ in _VECTOR_INDEXES:
+            self.cur.execute(f"DROP INDEX IF EXISTS {index_name};")
+    
+    def create_vector_indexes(self):
+        """
+        Build the ivfflat embedding indexes over the loaded rows.
+        
+        Building once after the load is much cheaper than maintaining the
+        indexes on every insert, and it lets the number of lists follow the
+        data: about the square root of the number of embedded rows.
+        """
+        print("\n📋 Creating vector indexes...")
+        
+        for index_name, table in _VECTOR_INDEXES:
+            self.cur.execute(f"SELECT count(*) FROM {table} WHERE embedding IS NOT NULL;")
+            row_count = self.cur.fetchone()[0]
+            lists = max(1, int(math.sqrt(row_count)))
+            self.cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {table} USING ivfflat (embedding vector_cosine_ops)
+                WITH (lists = {lists});
+            """)
+        
+        print("✅ Vector indexes created successfully")
+    
     def _generate_doc_id(self, doc: Dict) -> str:
         """Generate a unique document ID based on content."""
         content = f"{doc.get('state', '')}{doc.get('type', '')}{doc.get('topic', '')}"
@@ -133,14 +222,16 @@ class ExtraInfoTransformer:
     def transform_and_insert(
         self, 
         scraped_data: Dict[str, Tuple[List[Dict], List[Dict]]],
-        embeddings_func=None
+        embeddings_func: Optional[EmbeddingsFunc] = None
     ) -> Dict:
         """
         Transform and insert scraped data into PostgreSQL.
         
         Args:
             scraped_data: Dictionary with data types as keys and (state_docs, footnote_docs) as values
-            embeddings_func: Optional function to generate embeddings
+            embeddings_func: Optional function mapping a list of texts to a list of
+                embeddings, called once per insert batch. Wrap per-text functions
+                with batched_embeddings.
             
         Returns:
             Dictionary with insertion statistics
@@ -156,14 +247,28 @@ class ExtraInfoTransformer:
         }
         
         try:
+            # Rows and embeddings are computed before touching the database, so
+            # the table locks below do not span the (remote) embedding calls
+            rows = {}
+            for data_type, (state_docs, footnote_docs) in scraped_data.items():
+                print(f"\n🧮 Preparing {data_type}...")
+                rows[data_type] = (
+                    self._attach_embeddings(self._document_rows(state_docs, data_type), 7, 8, embeddings_func),
+                    self._attach_embeddings(self._footnote_rows(footnote_docs, data_type), 4, 5, embeddings_func)
+                )
+            
             self.connect()
+            self.configure_bulk_load()
             self.create_tables()
             
-            for data_type, (state_docs, footnote_docs) in scraped_data.items():
+            # Drop, load and rebuild commit together: a failed load keeps the old indexes
+            self.drop_vector_indexes()
+            
+            for data_type, (document_rows, footnote_rows) in rows.items():
                 print(f"\n📝 Inserting {data_type}...")
                 
-                doc_count = self._insert_documents(state_docs, data_type, embeddings_func)
-                footnote_count = self._insert_footnotes(footnote_docs, data_type, embeddings_func)
+                doc_count = self._insert_documents(document_rows)
+                footnote_count = self._insert_footnotes(footnote_rows)
                 
                 stats['by_type'][data_type] = {
                     'documents': doc_count,
@@ -172,6 +277,7 @@ class ExtraInfoTransformer:
                 stats['total_documents'] += doc_count
                 stats['total_footnotes'] += footnote_count
             
+            self.create_vector_indexes()
             self.conn.commit()
             print("\n✅ All data inserted successfully!")
             self._print_stats(stats)
@@ -186,11 +292,75 @@ class ExtraInfoTransformer:
         
         return stats
     
-    def _insert_documents(self, docs: List[Dict], data_type: str, embeddings_func) -> int:
-        """Insert state documents into database, including site_url in metadata."""
-        if not docs:
-            return 0
+    @staticmethod
+    def _attach_embeddings(
+        values: List[Tuple],
+        content_index: int,
+        embedding_index: int,
+        embeddings_func: Optional[EmbeddingsFunc]
+    ) -> List[Tuple]:
+        """
+        Fill the embedding slot of each row with a single batched embeddings call.
+        
+        Args:
+            values: Rows to insert, with None in the embedding position
+            content_index: Position of the text to embed in each row
+            embedding_index: Position of the embedding in each row
+            embeddings_func: Batched embeddings function, or None to keep the rows as they are
+            
+        Returns:
+            Rows with their embeddings filled in
+        """
+        if not embeddings_func or not values:
+            return values
+
+        embeddings = embeddings_func([v[content_index] for v in values])
+        return [
+            v[:embedding_index] + (embedding,) + v[embedding_index + 1:]
+            for v, embedding in zip(values, embeddings)
+        ]
 
+    def _copy_to_staging(self, table: str, columns: Sequence[str], values: List[Tuple]) -> str:
+        """
+        Stream rows into a temporary staging table shaped like the target table.
+        
+        COPY skips the per-row SQL parsing of an INSERT; the caller upserts
+        from the staging table and drops it.
+        
+        Args:
+            table: Target table name
+            columns: Target columns, in the order of each row
+            values: Rows to load
+            
+        Returns:
+            Name of the staging table
+        """
+        staging = f"staging_{table}"
+        column_list = ', '.join(columns)
+        self.cur.execute(
+            f"CREATE TEMP TABLE {staging} AS SELECT {column_list} FROM {table} WITH NO DATA;"
+        )
+
+        buffer = io.StringIO()
+        for row in values:
+            buffer.write('\t'.join(_copy_field(v) for v in row))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        self.cur.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", buffer)
+        return staging
+
+    def _document_rows(self, docs: List[Dict], data_type: str) -> List[Tuple]:
+        """
+        Build the deduplicated labor_law_documents rows, including site_url in metadata.
+        
+        Args:
+            docs: State documents of one data type
+            data_type: Data type the documents belong to
+            
+        Returns:
+            Rows in _DOCUMENT_COLUMNS order, with None in the embedding position
+        """
         values = []
         seen_ids = set()
 
@@ -209,10 +379,6 @@ class ExtraInfoTransformer:
             regulation_type = doc.get('type', '')
             regulation_category = doc.get('category', None)
 
-            embedding = None
-            if embeddings_func:
-                embedding = embeddings_func(content)
-
             metadata = {'original_doc': doc, 'site_url': site_url}  # site_url no metadata
 
             values.append((
@@ -224,84 +390,94 @@ class ExtraInfoTransformer:
                 regulation_type,
                 regulation_category,
                 content,
-                embedding,
-                json.dumps(metadata)
+                None,  # embedding, preenchido em lote por _attach_embeddings
+                json.dumps(metadata, ensure_ascii=False)
             ))
 
+        return values
+
+    def _insert_documents(self, values: List[Tuple]) -> int:
+        """Insert prepared state document rows into the database."""
         if not values:
             return 0
 
-        execute_values(
-            self.cur,
-            """
-            INSERT INTO labor_law_documents 
-            (doc_id, state, data_type, doc_category, topic, regulation_type, 
-            regulation_category, content, embedding, metadata)
-            VALUES %s
+        staging = self._copy_to_staging('labor_law_documents', _DOCUMENT_COLUMNS, values)
+        column_list = ', '.join(_DOCUMENT_COLUMNS)
+        self.cur.execute(f"""
+            INSERT INTO labor_law_documents ({column_list})
+            SELECT {column_list} FROM {staging}
             ON CONFLICT (doc_id) DO UPDATE SET
                 content = EXCLUDED.content,
                 embedding = EXCLUDED.embedding,
                 metadata = EXCLUDED.metadata,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            values
-        )
+                updated_at = CURRENT_TIMESTAMP;
+            DROP TABLE {staging};
+        """)
 
         print(f"  ✓ Inserted {len(values)} documents")
         return len(values)
 
 
-    def _insert_footnotes(self, footnotes, data_type, embeddings_func):
+    def _footnote_rows(self, footnotes: List[Dict], data_type: str) -> List[Tuple]:
         """
-        Insert footnotes into the database with deduplication and conflict handling.
+        Build the labor_law_footnotes rows, deduplicated by (site_id, footnote_id).
+        
+        Args:
+            footnotes: Footnote documents of one data type
+            data_type: Data type the footnotes belong to
+            
+        Returns:
+            Rows in _FOOTNOTE_COLUMNS order, with None in the embedding position
         """
-
-        if not footnotes:
-            return 0
-
         values = []
+        seen_keys = set()
         for fn in footnotes:
             site_id = fn.get('site_id') or fn.get('source_url') or 'unknown'
             footnote_id = fn.get('footnote_id') or fn.get('id')
+
+            # 🔹 Deduplicar pela chave (site_id, footnote_id)
+            key = (site_id, footnote_id)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
             topic = fn.get('topic', '')
             content = fn.get('content', '')
             metadata = fn.get('metadata', {})
 
-            embedding = embeddings_func(content) if embeddings_func else None
-
             values.append((
                 site_id,
                 footnote_id,
                 data_type,
                 topic,
                 content,
-                embedding,
-                json.dumps(metadata)
+                None,  # embedding, preenchido em lote por _attach_embeddings
+                json.dumps(metadata, ensure_ascii=False)
             ))
 
-        # 🔹 Deduplicar pela chave (site_id, footnote_id)
-        unique_values = {}
-        for v in values:
-            key = (v[0], v[1])
-            if key not in unique_values:
-                unique_values[key] = v
-        values = list(unique_values.values())
-
-        insert_query = """
-            INSERT INTO labor_law_footnotes
-            (site_id, footnote_id, data_type, topic, content, embedding, metadata)
-            VALUES %s
-            ON CONFLICT (site_id, footnote_id) DO UPDATE
-            SET
-                topic = EXCLUDED.topic,
-                content = EXCLUDED.content,
-                embedding = EXCLUDED.embedding,
-                metadata = EXCLUDED.metadata;
+        return values
+
+    def _insert_footnotes(self, values: List[Tuple]) -> int:
         """
+        Insert prepared footnote rows into the database with conflict handling.
+        """
+        if not values:
+            return 0
 
         try:
-            execute_values(self.cur, insert_query, values, page_size=100)
-            self.conn.commit()
+            staging = self._copy_to_staging('labor_law_footnotes', _FOOTNOTE_COLUMNS, values)
+            column_list = ', '.join(_FOOTNOTE_COLUMNS)
+            self.cur.execute(f"""
+                INSERT INTO labor_law_footnotes ({column_list})
+                SELECT {column_list} FROM {staging}
+                ON CONFLICT (site_id, footnote_id) DO UPDATE
+                SET
+                    topic = EXCLUDED.topic,
+                    content = EXCLUDED.content,
+                    embedding = EXCLUDED.embedding,
+                    metadata = EXCLUDED.metadata;
+                DROP TABLE {staging};
+            """)
             print(f"  ✓ Inserted {len(values)} footnotes (deduplicated).")
         except Exception as e:
             self.conn.rollback()
@@ -11,13 +11,11 @@ This module implements the transformation logic for creating a dimensional model
 
 import logging
 import re
-import sys
 import warnings
 from typing import Dict, Optional
 
 import pandas as pd
 
-sys.path.append('..')
 from config import TIPPED_WAGE_TYPE, WAGE_CATEGORIES
 from utils import generate_hash
 